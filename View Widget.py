@@ -3,21 +3,183 @@ import subprocess
 import importlib
 import os
 import webbrowser
-import yt_dlp
+import sqlite3
+import itertools
+import functools
+import re
+from array import array
+import json
+import http.client
+import urllib.parse
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout,
     QHBoxLayout, QPushButton, QLineEdit, QProgressBar,
     QScrollArea, QFrame, QSizePolicy
 )
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, Qt, QObject, QThread, QPropertyAnimation, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QPixmap, QFont
 
-# Ensure yt-dlp is installed
-try:
-    importlib.import_module("yt_dlp")
-except ImportError:
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "yt-dlp"])
-    import yt_dlp
+# Seconds a fetched result stays fresh. YouTube sits just under the 60s refresh so every tick refetches.
+CACHE_TTL = {"YouTube": 50, "TikTok": 300}
+CACHE_MAX_ENTRIES = 512
+# Last known stats per video, kept across restarts
+CACHE_DB_PATH = os.path.expanduser("~/.social_stats_cache.db")
+
+# Link host -> (platform, logo)
+_PLATFORM_RE = re.compile(r"(youtu\.be|youtube\.com|tiktok\.com)")
+_PLATFORM_MAP = {
+    "youtu.be": ("YouTube", "youtube_logo.png"),
+    "youtube.com": ("YouTube", "youtube_logo.png"),
+    "tiktok.com": ("TikTok", "tiktok_logo.png"),
+}
+
+# YouTube Data API v3 is used for YouTube cards when a key is set; otherwise everything goes through yt-dlp
+YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY")
+YOUTUBE_API_HOST = "www.googleapis.com"
+YOUTUBE_API_PATH = "/youtube/v3/videos"
+YOUTUBE_API_BATCH = 50
+
+# Per-card refresh backoff (seconds) while a video's stats stay unchanged
+BACKOFF_MIN = 60
+BACKOFF_MAX = 600
+
+YDL_OPTS = {"quiet": True, "skip_download": True, "extract_flat": False, "no_warnings": True, "socket_timeout": 10}
+_ydl_local = threading.local()
+
+# yt-dlp is imported on first fetch (installing it if missing) so its extractor modules don't delay startup.
+# A failed install is remembered so later fetches fail fast instead of rerunning pip.
+_ydl_mod = None
+_ydl_unavailable = False
+_ydl_import_lock = threading.Lock()
+
+
+def _load_yt_dlp():
+    global _ydl_mod, _ydl_unavailable
+    if _ydl_mod is None and not _ydl_unavailable:
+        with _ydl_import_lock:
+            if _ydl_mod is None and not _ydl_unavailable:
+                try:
+                    import yt_dlp as _ydl_mod
+                except ImportError:
+                    try:
+                        subprocess.check_call([sys.executable, "-m", "pip", "install", "yt-dlp"])
+                        importlib.invalidate_caches()
+                        import yt_dlp as _ydl_mod
+                    except Exception as e:
+                        _ydl_unavailable = True
+                        print(f"yt-dlp is not installed and installing it failed: {e}")
+    return _ydl_mod
+
+
+def _get_ydl():
+    # One YoutubeDL per worker thread: extractors and the HTTP session are set up once and reused.
+    # None if yt-dlp is unavailable.
+    ydl = getattr(_ydl_local, "ydl", None)
+    if ydl is None:
+        ydl_mod = _load_yt_dlp()
+        if ydl_mod is None:
+            return None
+        ydl = _ydl_local.ydl = ydl_mod.YoutubeDL(YDL_OPTS)
+    return ydl
+
+
+# One keep-alive connection shared by all pool threads, so successive refreshes reuse the TLS session
+_api_conn = None
+_api_lock = threading.Lock()
+
+
+def _youtube_api_get(query):
+    global _api_conn
+    with _api_lock:
+        if _api_conn is None:
+            _api_conn = http.client.HTTPSConnection(YOUTUBE_API_HOST, timeout=10)
+        for attempt in range(2):
+            try:
+                _api_conn.request("GET", f"{YOUTUBE_API_PATH}?{query}")
+                resp = _api_conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server dropped the idle connection; reconnect once
+                _api_conn.close()
+                if attempt:
+                    raise
+            except Exception:
+                # Timeouts and the rest aren't retried; reset so the next call starts clean
+                _api_conn.close()
+                raise
+    if resp.status != 200:
+        raise RuntimeError(f"HTTP {resp.status} {resp.reason}")
+    return json.loads(body)
+
+
+# Scaled logo pixmaps, shared by every card of the same platform
+_LOGO_CACHE = {}
+
+
+def _get_logo(path):
+    pixmap = _LOGO_CACHE.get(path)
+    if pixmap is None and os.path.exists(path):
+        pixmap = QPixmap(path).scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        _LOGO_CACHE[path] = pixmap
+    return pixmap
+
+
+# Card stylesheets, shared by every VideoCard
+CARD_STYLE = """
+    QFrame {
+        background-color: #e6e6e6;
+        border-radius: 10px;
+        padding: 10px;
+    }
+"""
+LINK_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #0078d7;
+        color: #ffffff;
+        border-radius: 5px;
+        padding: 3px 7px;
+        max-width: 60px;
+    }
+    QPushButton:hover {
+        background-color: #005a9e;
+    }
+"""
+REMOVE_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #d9534f;
+        color: #ffffff;
+        border-radius: 5px;
+        padding: 3px 7px;
+        max-width: 70px;
+    }
+    QPushButton:hover {
+        background-color: #c12e2a;
+    }
+"""
+
+# Progress bar gradient (#0078d7 to a lighter blue) in 51 steps, formatted once for the whole process
+PROGRESS_STYLE_STEPS = 50
+PROGRESS_STYLES = [
+    "QProgressBar { background-color: #e0e0e0; border-radius: 5px; }"
+    f"QProgressBar::chunk {{ background-color: rgb(0,{120 + i * 50 // PROGRESS_STYLE_STEPS},"
+    f"{215 + i * 40 // PROGRESS_STYLE_STEPS}); border-radius: 5px; }}"
+    for i in range(PROGRESS_STYLE_STEPS + 1)
+]
+
+# Fonts are built on first use (QFont needs the QApplication) and shared by every card
+_FONT_CACHE = {}
+
+
+def _get_font(size, bold=False):
+    font = _FONT_CACHE.get((size, bold))
+    if font is None:
+        font = _FONT_CACHE[(size, bold)] = QFont("Segoe UI", size, QFont.Bold if bold else QFont.Normal)
+    return font
 
 
 class VideoCard(QFrame):
@@ -25,18 +187,10 @@ class VideoCard(QFrame):
         super().__init__()
         self.platform = platform
         self.url = url
-        self.prev_views = None
-        self.prev_likes = None
         self.parent_widget = parent_widget
 
         # Card style
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #e6e6e6;
-                border-radius: 10px;
-                padding: 10px;
-            }
-        """)
+        self.setStyleSheet(CARD_STYLE)
         self.setFrameShadow(QFrame.Raised)
 
         main_layout = QHBoxLayout()
@@ -47,8 +201,9 @@ class VideoCard(QFrame):
         logo_container = QVBoxLayout()
         logo_container.setAlignment(Qt.AlignVCenter)
         self.logo_label = QLabel()
-        if os.path.exists(logo_path):
-            self.logo_label.setPixmap(QPixmap(logo_path).scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        pixmap = _get_logo(logo_path)
+        if pixmap:
+            self.logo_label.setPixmap(pixmap)
         logo_container.addWidget(self.logo_label)
         main_layout.addLayout(logo_container)
 
@@ -60,20 +215,20 @@ class VideoCard(QFrame):
 
         # Title label
         self.title_label = QLabel(platform)
-        self.title_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        self.title_label.setFont(_get_font(11, bold=True))
         self.title_label.setWordWrap(True)
         self.title_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         self.info_layout.addWidget(self.title_label)
 
         # Views label
         self.views_label = QLabel("👀 Views: 0")
-        self.views_label.setFont(QFont("Segoe UI", 10))
+        self.views_label.setFont(_get_font(10))
         self.views_label.setAlignment(Qt.AlignLeft)
         self.info_layout.addWidget(self.views_label)
 
         # Likes label
         self.likes_label = QLabel("👍 Likes: 0")
-        self.likes_label.setFont(QFont("Segoe UI", 10))
+        self.likes_label.setFont(_get_font(10))
         self.likes_label.setAlignment(Qt.AlignLeft)
         self.info_layout.addWidget(self.likes_label)
 
@@ -84,35 +239,13 @@ class VideoCard(QFrame):
 
         # Link button
         self.link_button = QPushButton("Link")
-        self.link_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d7;
-                color: #ffffff;
-                border-radius: 5px;
-                padding: 3px 7px;
-                max-width: 60px;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-        """)
+        self.link_button.setStyleSheet(LINK_BUTTON_STYLE)
         self.link_button.clicked.connect(lambda: webbrowser.open(self.url))
         buttons_layout.addWidget(self.link_button)
 
         # Remove button
         self.remove_button = QPushButton("Remove")
-        self.remove_button.setStyleSheet("""
-            QPushButton {
-                background-color: #d9534f;
-                color: #ffffff;
-                border-radius: 5px;
-                padding: 3px 7px;
-                max-width: 70px;
-            }
-            QPushButton:hover {
-                background-color: #c12e2a;
-            }
-        """)
+        self.remove_button.setStyleSheet(REMOVE_BUTTON_STYLE)
         self.remove_button.clicked.connect(self.remove_self)
         buttons_layout.addWidget(self.remove_button)
 
@@ -122,25 +255,21 @@ class VideoCard(QFrame):
         self.setLayout(main_layout)
 
     # ----------------- Update stats with trend difference -----------------
-    def update_stats(self, title, views, likes):
+    def update_stats(self, title, views, likes, prev_views=None, prev_likes=None):
         # Views difference
-        if self.prev_views is not None:
-            diff_views = views - self.prev_views
+        if prev_views is not None:
+            diff_views = views - prev_views
             view_arrow = f" 📈(+{diff_views})" if diff_views > 0 else f" 📉({diff_views})" if diff_views < 0 else ""
         else:
             view_arrow = ""
 
         # Likes difference
-        if self.prev_likes is not None:
-            diff_likes = likes - self.prev_likes
+        if prev_likes is not None:
+            diff_likes = likes - prev_likes
             like_arrow = f" 📈(+{diff_likes})" if diff_likes > 0 else f" 📉({diff_likes})" if diff_likes < 0 else ""
         else:
             like_arrow = ""
 
-        # Update previous values
-        self.prev_views = views
-        self.prev_likes = likes
-
         # Update labels
         self.title_label.setText(title)
         self.views_label.setText(f"👀 Views: {views:,}{view_arrow}")
@@ -150,16 +279,89 @@ class VideoCard(QFrame):
     def remove_self(self):
         if self.parent_widget:
             self.parent_widget.cards_layout.removeWidget(self)
-            self.parent_widget.video_cards.remove(self)
+            self.parent_widget.remove_card(self)
             self.setParent(None)
 
 
+class StatsWorker(QObject):
+    # card_id, title, views, likes (object so large counts don't overflow a C int),
+    # fetched (False when served from cache or on error)
+    statsReady = pyqtSignal(object, str, object, object, bool)
+
+    def __init__(self, fetch_stats, fetch_youtube_batch):
+        super().__init__()
+        self.fetch_stats = fetch_stats
+        self.fetch_youtube_batch = fetch_youtube_batch
+        self._pool = ThreadPoolExecutor(max_workers=8)
+
+    # ----------------- Fetch on the worker thread -----------------
+    @pyqtSlot(list)
+    def fetch(self, cards_snapshot):
+        # Each snapshot entry is (card ids, url, platform) for one video, shared by all of those cards.
+        # Only submits work: results are emitted from the pool as they finish, so this slot never blocks.
+        youtube = []
+        for entry in cards_snapshot:
+            card_ids, url, platform = entry
+            if platform == "YouTube" and YOUTUBE_API_KEY:
+                youtube.append(entry)
+            else:
+                self._submit([entry], self._fetch_one, url, platform)
+        for i in range(0, len(youtube), YOUTUBE_API_BATCH):
+            batch = youtube[i:i + YOUTUBE_API_BATCH]
+            self._submit(batch, self.fetch_youtube_batch, [url for _, url, _ in batch])
+
+    def _fetch_one(self, url, platform):
+        return [self.fetch_stats(url, platform)]
+
+    def _submit(self, entries, fn, *args):
+        # fn returns one result per snapshot entry, or None where it couldn't get one
+        try:
+            future = self._pool.submit(fn, *args)
+        except RuntimeError:
+            return  # Pool already shut down on close
+        future.add_done_callback(functools.partial(self._emit_results, entries))
+
+    def _emit_results(self, entries, future):
+        # Runs on a pool thread; statsReady is queued across to the GUI thread
+        if future.cancelled():
+            return
+        for (card_ids, url, platform), result in zip(entries, future.result()):
+            if result is None:
+                # Left unanswered by a batch request; fetch it as its own pool task
+                self._submit([(card_ids, url, platform)], self._fetch_one, url, platform)
+                continue
+            title, views, likes, fetched = result
+            for card_id in card_ids:
+                self.statsReady.emit(card_id, title, views, likes, fetched)
+
+    def stop(self):
+        # Drop queued fetches; running ones finish in the background without holding up the window
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
 class SocialStatsWidget(QWidget):
+    fetchRequested = pyqtSignal(list)
+
     def __init__(self):
         super().__init__()
         self.refresh_interval = 60
-        self.timer_count = 0
-        self.video_cards = []
+        # Cards by id, plus their state as parallel columns (one slot per card, found through _slots).
+        # -1 in prev_views/prev_likes means not fetched yet.
+        self.video_cards = {}
+        self._counter = itertools.count()
+        self._slots = {}
+        self.card_ids = []
+        self.urls = []
+        self.platforms = []
+        self.prev_views = array("q")
+        self.prev_likes = array("q")
+        self.requested_at = array("d")
+        self.next_refresh_at = array("d")
+        self.backoff = array("l")
+        self._cache = OrderedDict()  # normalized url -> (timestamp, title, views, likes)
+        self._cache_lock = threading.Lock()
+        self._db = self._open_cache_db()
+        self._db_lock = threading.Lock()
 
         self.setStyleSheet("background-color: #ffffff;")
         main_layout = QVBoxLayout()
@@ -210,45 +412,141 @@ class SocialStatsWidget(QWidget):
         self.progress = QProgressBar()
         self.progress.setMaximum(self.refresh_interval * 10)
         self.progress.setTextVisible(False)
-        self.progress.setStyleSheet("""
-            QProgressBar {
-                background-color: #e0e0e0;
-                border-radius: 5px;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d7;
-                border-radius: 5px;
-            }
-        """)
+        self.progress.setStyleSheet(PROGRESS_STYLES[0])
+        self._style_idx = 0
         main_layout.addWidget(self.progress)
 
         self.setLayout(main_layout)
 
-        # Timer for auto-refresh & progress animation
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_refresh)
-        self.timer.start(100)
+        # Timer for auto-refresh
+        self.fetch_timer = QTimer()
+        self.fetch_timer.timeout.connect(self.refresh)
+        self.fetch_timer.start(self.refresh_interval * 1000)
+
+        # Progress fill animated by Qt, independent of the refresh timer
+        self.progress_anim = QPropertyAnimation(self.progress, b"value")
+        self.progress_anim.setDuration(self.refresh_interval * 1000)
+        self.progress_anim.setStartValue(0)
+        self.progress_anim.setEndValue(self.progress.maximum())
+        self.progress_anim.setLoopCount(-1)
+        self.progress.valueChanged.connect(self.update_progress_style)
+        self.progress_anim.start()
+
+        # Worker thread for yt-dlp calls so the window never blocks on the network
+        self.worker_thread = QThread()
+        self.worker = StatsWorker(self.fetch_stats, self.fetch_youtube_batch)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.statsReady.connect(self._queue_stats)
+        self.fetchRequested.connect(self.worker.fetch)
+        self.worker_thread.start()
+
+        # Results arriving in the same event-loop pass are applied together in one repaint
+        self._pending_stats = []
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_stats)
 
     # ----------------- Add videos -----------------
     def add_videos(self):
         links = [link.strip() for link in self.link_input.text().split(",") if link.strip()]
-        for link in links:
-            if "youtube" in link or "youtu.be" in link:
-                card = VideoCard("YouTube", "youtube_logo.png", link, parent_widget=self)
-            elif "tiktok" in link:
-                card = VideoCard("TikTok", "tiktok_logo.png", link, parent_widget=self)
-            else:
-                continue
-            self.video_cards.insert(0, card)  # Add new videos at the top
-            self.cards_layout.insertWidget(0, card)
+        self.cards_container.setUpdatesEnabled(False)
+        try:
+            self._insert_cards(links)
+        finally:
+            self.cards_container.setUpdatesEnabled(True)
         self.fetch_all_stats()
         self.link_input.clear()
 
+    def _insert_cards(self, links):
+        for link in links:
+            m = _PLATFORM_RE.search(link)
+            if not m:
+                continue
+            platform, logo = _PLATFORM_MAP[m.group(1)]
+            card = VideoCard(platform, logo, link, parent_widget=self)
+            card._cid = cid = next(self._counter)
+            self.video_cards[cid] = card
+            self._slots[cid] = len(self.card_ids)
+            self.card_ids.append(cid)
+            self.urls.append(link)
+            self.platforms.append(card.platform)
+            self.prev_views.append(-1)
+            self.prev_likes.append(-1)
+            self.requested_at.append(0)
+            self.next_refresh_at.append(0)
+            self.backoff.append(BACKOFF_MIN)
+            self.cards_layout.insertWidget(0, card)  # Add new videos at the top
+            # Show the last known stats straight away; the live fetch still runs
+            stored = self._db_get(self.normalize(link, platform))
+            if stored:
+                self._apply_stats(cid, *stored[1:], fetched=False)
+
+    def remove_card(self, card):
+        if self.video_cards.pop(card._cid, None) is None:
+            return
+        # Swap-remove: the last slot moves into the freed one, so no column has to shift
+        i = self._slots.pop(card._cid)
+        for column in (self.card_ids, self.urls, self.platforms, self.prev_views, self.prev_likes,
+                       self.requested_at, self.next_refresh_at, self.backoff):
+            column[i] = column[-1]
+            column.pop()
+        if i < len(self.card_ids):
+            self._slots[self.card_ids[i]] = i
+
     # ----------------- Fetch stats -----------------
     def fetch_all_stats(self):
-        for card in self.video_cards:
-            title, views, likes = self.fetch_stats(card.url, card.platform)
-            card.update_stats(title, views, likes)
+        # Skip cards still backing off (with a second of slack for timer jitter)
+        now = time.monotonic()
+        next_refresh_at = self.next_refresh_at
+        # Cards showing the same video share one fetch, grouped by normalized url
+        groups = {}
+        for i, (cid, url, platform) in enumerate(zip(self.card_ids, self.urls, self.platforms)):
+            if now + 1 >= next_refresh_at[i]:
+                self.requested_at[i] = now
+                key = self.normalize(url, platform)
+                if key in groups:
+                    groups[key][0].append(cid)
+                else:
+                    groups[key] = ([cid], url, platform)
+        # Only plain data crosses to the worker; labels are updated back here in _flush_stats
+        if groups:
+            self.fetchRequested.emit(list(groups.values()))
+
+    def _queue_stats(self, card_id, title, views, likes, fetched):
+        self._pending_stats.append((card_id, title, views, likes, fetched))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(0)
+
+    def _flush_stats(self):
+        pending, self._pending_stats = self._pending_stats, []
+        self.cards_container.setUpdatesEnabled(False)
+        try:
+            for stats in pending:
+                self._apply_stats(*stats)
+        finally:
+            self.cards_container.setUpdatesEnabled(True)
+            self.cards_container.update()
+
+    def _apply_stats(self, card_id, title, views, likes, fetched=True):
+        # The card may have been removed while its stats were in flight
+        i = self._slots.get(card_id)
+        if i is None:
+            return
+        prev_views, prev_likes = self.prev_views[i], self.prev_likes[i]
+        self.video_cards[card_id].update_stats(
+            title, views, likes,
+            prev_views if prev_views >= 0 else None,
+            prev_likes if prev_likes >= 0 else None,
+        )
+        # Only a live result says whether the video is still moving; cached ones leave the card due
+        if fetched:
+            if views != prev_views or likes != prev_likes:
+                self.backoff[i] = BACKOFF_MIN
+            else:
+                self.backoff[i] = min(self.backoff[i] * 2, BACKOFF_MAX)
+            self.next_refresh_at[i] = self.requested_at[i] + self.backoff[i]
+        self.prev_views[i] = views
+        self.prev_likes[i] = likes
 
     def normalize_youtube(self, url):
         if "youtube.com/shorts/" in url:
@@ -265,45 +563,161 @@ class SocialStatsWidget(QWidget):
     def normalize_tiktok(self, url):
         return url.split("?")[0]
 
+    def normalize(self, url, platform):
+        if platform.lower() == "youtube":
+            return self.normalize_youtube(url)
+        return self.normalize_tiktok(url)
+
     def fetch_stats(self, url, platform=None):
+        url = self.normalize(url, platform)
+
+        hit = self._cache_get(url, platform)
+        if hit:
+            return (*hit, False)
+
+        ydl = _get_ydl()
+        if ydl is None:
+            return "Error", 0, 0, False
+
         try:
-            if platform.lower() == "youtube":
-                url = self.normalize_youtube(url)
-            else:
-                url = self.normalize_tiktok(url)
-            ydl_opts = {"quiet": True, "skip_download": True}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # Only title/views/likes are needed, so skip format resolution and post-processing
+            info = ydl.extract_info(url, download=False, process=False)
+            if platform == "TikTok" and (info.get("view_count") is None or info.get("like_count") is None):
                 info = ydl.extract_info(url, download=False)
             views = info.get("view_count") or 0
             likes = info.get("like_count") or 0
             title = info.get("title", "Unknown Title")
-            return title, views, likes
         except Exception as e:
             print(f"Error fetching {url}: {e}")
-            return "Error", 0, 0
+            return "Error", 0, 0, False
+
+        self._cache_put(url, title, views, likes)
+        return title, views, likes, True
+
+    def fetch_youtube_batch(self, urls):
+        # One Data API request for up to 50 videos; None for any it can't answer, which the worker
+        # then fetches through yt-dlp in parallel
+        keys = [self.normalize_youtube(url) for url in urls]
+        results = {}
+        missing = []
+        for key in keys:
+            hit = self._cache_get(key, "YouTube")
+            if hit:
+                results[key] = (*hit, False)
+            elif "watch?v=" in key:
+                missing.append(key.split("watch?v=")[-1])
+
+        if missing:
+            query = urllib.parse.urlencode({
+                "part": "statistics,snippet",
+                "id": ",".join(missing),
+                "key": YOUTUBE_API_KEY,
+            })
+            try:
+                data = _youtube_api_get(query)
+                for item in data.get("items", []):
+                    stats = item.get("statistics", {})
+                    title = item.get("snippet", {}).get("title", "Unknown Title")
+                    views = int(stats.get("viewCount", 0))
+                    likes = int(stats.get("likeCount", 0))
+                    key = f"https://www.youtube.com/watch?v={item['id']}"
+                    self._cache_put(key, title, views, likes)
+                    results[key] = (title, views, likes, True)
+            except Exception as e:
+                print(f"Error fetching YouTube API batch: {e}")
+
+        return [results.get(key) for key in keys]
+
+    # Cache helpers; called from worker threads, hence the locks
+    def _cache_get(self, key, platform):
+        ttl = CACHE_TTL.get(platform, 60)
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit and time.monotonic() - hit[0] < ttl:
+                self._cache.move_to_end(key)
+                return hit[1:]
+
+        # Fall back to the on-disk cache, e.g. right after a restart
+        stored = self._db_get(key)
+        if stored and time.time() - stored[0] < ttl:
+            age = time.time() - stored[0]
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic() - age, *stored[1:])
+            return stored[1:]
+        return None
+
+    def _cache_put(self, key, title, views, likes):
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), title, views, likes)
+            self._cache.move_to_end(key)
+            if len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        self._db_put(key, title, views, likes)
+
+    def _open_cache_db(self):
+        try:
+            db = sqlite3.connect(CACHE_DB_PATH, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                "url_key TEXT PRIMARY KEY, ts INTEGER, title TEXT, views INTEGER, likes INTEGER)"
+            )
+            return db
+        except sqlite3.Error as e:
+            print(f"Stats cache disabled, can't open {CACHE_DB_PATH}: {e}")
+            return None
+
+    def _db_get(self, key):
+        # (timestamp, title, views, likes) of the last stored fetch, or None.
+        # _db is checked under the lock since closeEvent clears it while pool threads may still be running.
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return None
+                return self._db.execute(
+                    "SELECT ts, title, views, likes FROM meta WHERE url_key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading stats cache for {key}: {e}")
+            return None
+
+    def _db_put(self, key, title, views, likes):
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (url_key, ts, title, views, likes) VALUES (?, ?, ?, ?, ?)",
+                    (key, int(time.time()), title, views, likes),
+                )
+        except sqlite3.Error as e:
+            print(f"Error writing stats cache for {key}: {e}")
 
     # ----------------- Auto-refresh -----------------
-    def update_refresh(self):
-        self.timer_count += 1
-        self.progress.setValue(self.timer_count)
-        ratio = self.timer_count / (self.refresh_interval * 10)
-        r = int(0 + ratio * 0)
-        g = int(120 + ratio * 50)
-        b = int(215 + ratio * 40)
-        self.progress.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: #e0e0e0;
-                border-radius: 5px;
-            }}
-            QProgressBar::chunk {{
-                background-color: rgb({r},{g},{b});
-                border-radius: 5px;
-            }}
-        """)
-        if self.timer_count >= self.refresh_interval * 10:
-            self.timer_count = 0
-            self.progress.reset()
-            self.fetch_all_stats()
+    def refresh(self):
+        # Restart the fill so the bar stays in step with the fetch timer
+        self.progress_anim.setCurrentTime(0)
+        self.fetch_all_stats()
+
+    def update_progress_style(self, value):
+        idx = value * PROGRESS_STYLE_STEPS // self.progress.maximum()
+        if idx != self._style_idx:
+            self._style_idx = idx
+            self.progress.setStyleSheet(PROGRESS_STYLES[idx])
+
+    def closeEvent(self, event):
+        self.fetch_timer.stop()
+        self.progress_anim.stop()
+        self.worker.stop()
+        # The worker slot only submits to the pool, so its thread stops without waiting on the network
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":